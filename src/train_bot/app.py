@@ -9,7 +9,16 @@ from .rtt_api import RttClient
 from .transport_api import TransportApiClient
 
 
-def build_application(settings: BotSettings) -> Application:
+class TrainBotApplication(Application):
+    """Application that keeps the bot's settings and providers as direct attributes."""
+
+    __slots__ = ("rail_providers", "settings")
+
+    rail_providers: list[RailProvider]
+    settings: BotSettings
+
+
+def build_application(settings: BotSettings) -> TrainBotApplication:
     """Configure the Telegram application with command handlers."""
 
     providers: list[RailProvider] = []
@@ -31,13 +40,17 @@ def build_application(settings: BotSettings) -> Application:
 
     application = (
         ApplicationBuilder()
+        .application_class(TrainBotApplication)
         .token(settings.telegram_token)
+        .concurrent_updates(True)
         .post_shutdown(_close_client)
         .build()
     )
 
     application.bot_data["settings"] = settings
     application.bot_data["rail_providers"] = providers
+    application.settings = settings
+    application.rail_providers = providers
 
     application.add_handler(CommandHandler("start", start))
     application.add_handler(CommandHandler("help", help_command))
@@ -2,17 +2,21 @@ from __future__ import annotations
 
 from dotenv import load_dotenv
 
-from .app import build_application
-from .config import BotSettings
-
 
 def main() -> None:
     """Entry point for launching the Telegram bot."""
 
     load_dotenv()
+
+    from .config import BotSettings
+
     settings = BotSettings.from_env()
+
+    # Deferred so configuration errors surface before telegram/httpx are imported.
+    from .app import build_application
+
     application = build_application(settings)
-    application.run_polling()
+    application.run_polling(timeout=50, poll_interval=0.0)
 
 
 def run() -> None:  # pragma: no cover - compatibility alias
@@ -1,20 +1,41 @@
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import re
 from dataclasses import dataclass
-from typing import Sequence
+from typing import Final, Sequence
 
 from telegram import Update
 from telegram.ext import ContextTypes
 
+from . import station_cache
 from .config import BotSettings
 from .formatter import format_departures
 from .models import StationSummary
 from .providers import AllProvidersFailed, RailProvider, call_with_fallback
 
+_TIME_RE = re.compile(r"(?:\bat\s+)?(\d{1,2}:\d{2})$")
+_SPLIT_RE = re.compile(r"\s+(?:to|->)\s+")
 
-@dataclass(frozen=True)
+_START_MSG: Final[str] = (
+    "👋 Hi! Send /journey followed by origin and destination, e.g.\n"
+    "/journey London Waterloo to Winchester at 17:30\n\n"
+    "Need a station code? Try /stations <search term>."
+)
+
+_HELP_MSG: Final[str] = (
+    "Usage:\n"
+    "  /journey <origin> to <destination> [at HH:MM]\n"
+    "  /stations <search term>\n\n"
+    "Examples:\n"
+    "  /journey Manchester Piccadilly to London Euston\n"
+    "  /journey Leeds to York at 09:15\n"
+    "  /stations Paddington"
+)
+
+
+@dataclass(frozen=True, slots=True)
 class JourneyRequest:
     origin_query: str
     destination_query: str
@@ -24,25 +45,11 @@ class JourneyRequest:
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Send greeting and usage basics."""
 
-    message = (
-        "👋 Hi! Send /journey followed by origin and destination, e.g.\n"
-        "/journey London Waterloo to Winchester at 17:30\n\n"
-        "Need a station code? Try /stations <search term>."
-    )
-    await update.message.reply_text(message)
+    await update.message.reply_text(_START_MSG)
 
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    message = (
-        "Usage:\n"
-        "  /journey <origin> to <destination> [at HH:MM]\n"
-        "  /stations <search term>\n\n"
-        "Examples:\n"
-        "  /journey Manchester Piccadilly to London Euston\n"
-        "  /journey Leeds to York at 09:15\n"
-        "  /stations Paddington"
-    )
-    await update.message.reply_text(message)
+    await update.message.reply_text(_HELP_MSG)
 
 
 async def stations(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -55,8 +62,8 @@ async def stations(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
     providers = _providers(context)
     try:
-        results, provider_name, errors = await call_with_fallback(
-            providers, "search_station", query, limit=5, retry_on_empty=True
+        results, provider_name, errors = await station_cache.search_station(
+            providers, query, limit=5
         )
     except AllProvidersFailed as exc:
         await update.message.reply_text(
@@ -91,29 +98,29 @@ async def journey(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         await update.message.reply_text(str(exc))
         return
 
+    if request.origin_query.strip().casefold() == request.destination_query.strip().casefold():
+        await update.message.reply_text("Origin and destination must differ.")
+        return
+
     settings = _settings(context)
     providers = _providers(context)
 
-    try:
-        origin_candidates, origin_provider, origin_errors = await call_with_fallback(
-            providers,
-            "search_station",
-            request.origin_query,
-            limit=3,
-            retry_on_empty=True,
-        )
-        destination_candidates, destination_provider, destination_errors = await call_with_fallback(
-            providers,
-            "search_station",
-            request.destination_query,
-            limit=3,
-            retry_on_empty=True,
-        )
-    except AllProvidersFailed as exc:
-        await update.message.reply_text(
-            "All data providers failed while resolving stations:\n" + "\n".join(exc.messages)
-        )
-        return
+    origin_result, destination_result = await asyncio.gather(
+        station_cache.search_station(providers, request.origin_query, limit=3),
+        station_cache.search_station(providers, request.destination_query, limit=3),
+        return_exceptions=True,
+    )
+    for result in (origin_result, destination_result):
+        if isinstance(result, AllProvidersFailed):
+            await update.message.reply_text(
+                "All data providers failed while resolving stations:\n" + "\n".join(result.messages)
+            )
+            return
+        if isinstance(result, BaseException):
+            raise result
+
+    origin_candidates, origin_provider, origin_errors = origin_result
+    destination_candidates, destination_provider, destination_errors = destination_result
 
     if not origin_candidates:
         await update.message.reply_text("Couldn't find a station matching the origin.")
@@ -141,12 +148,9 @@ async def journey(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         )
         return
 
-    origin_name = _tidy_station_name(origin.name)
-    destination_name = _tidy_station_name(destination.name)
-
     message = format_departures(
-        origin_name,
-        destination_name,
+        origin.name,
+        destination.name,
         departures,
         requested_time=request.when,
     )
@@ -169,22 +173,21 @@ async def journey(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
     diagnostic_note = ("\n" + "\n".join(diagnostics)) if diagnostics else ""
 
-    await update.message.reply_text(message + suffix + provider_note + diagnostic_note)
+    await update.message.reply_text("".join((message, suffix, provider_note, diagnostic_note)))
 
 
 def parse_journey_query(text: str) -> JourneyRequest:
     """Parse free text into a JourneyRequest."""
 
-    time_match = re.search(r"(?:\bat\s+)?(\d{1,2}:\d{2})$", text)
+    time_match = _TIME_RE.search(text)
     when: dt.datetime | None = None
     if time_match:
         time_str = time_match.group(1)
         hours, minutes = map(int, time_str.split(":"))
-        now = dt.datetime.now()
-        when = now.replace(hour=hours, minute=minutes, second=0, microsecond=0)
+        when = dt.datetime.combine(dt.date.today(), dt.time(hours, minutes))
         text = text[: time_match.start()].strip()
 
-    parts = re.split(r"\s+(?:to|->)\s+", text, maxsplit=1)
+    parts = _SPLIT_RE.split(text, maxsplit=1)
     if len(parts) != 2:
         raise ValueError("Couldn't parse journey. Use '/journey origin to destination [at HH:MM]'.")
 
@@ -197,19 +200,21 @@ def parse_journey_query(text: str) -> JourneyRequest:
 
 
 def _strip_from_keyword(value: str) -> str:
-    return re.sub(r"^(?:from|to)\s+", "", value.strip(), flags=re.IGNORECASE)
-
-
-def _tidy_station_name(name: str) -> str:
-    return re.sub(r"\bRail (Station|Stn)\b", "", name).strip()
+    value = value.strip()
+    prefix = value[:5].lower()
+    if prefix.startswith("from "):
+        return value[5:].lstrip()
+    if prefix.startswith("to "):
+        return value[3:].lstrip()
+    return value
 
 
 def _settings(context: ContextTypes.DEFAULT_TYPE) -> BotSettings:
-    return context.application.bot_data["settings"]
+    return context.application.settings
 
 
 def _providers(context: ContextTypes.DEFAULT_TYPE) -> Sequence[RailProvider]:
-    return context.application.bot_data["rail_providers"]
+    return context.application.rail_providers
 
 
 def _format_alternatives(
@@ -218,15 +223,20 @@ def _format_alternatives(
 ) -> str:
     origin_suffix = _format_station_candidates("Origin suggestions", origin_candidates)
     destination_suffix = _format_station_candidates("Destination suggestions", destination_candidates)
-    additions = f"\n\n{origin_suffix}{destination_suffix}"
-    return additions if additions.strip() else ""
+    if not origin_suffix and not destination_suffix:
+        return ""
+    return "".join(("\n\n", origin_suffix, destination_suffix))
 
 
 def _format_station_candidates(label: str, candidates: Sequence[StationSummary]) -> str:
     if len(candidates) <= 1:
         return ""
 
-    formatted = "\n".join(
-        f"- {station.name} — {station.station_code}" for station in candidates[1:3]
+    first = candidates[1]
+    if len(candidates) == 2:
+        return f"{label}:\n- {first.name} — {first.station_code}\n"
+    second = candidates[2]
+    return (
+        f"{label}:\n- {first.name} — {first.station_code}\n"
+        f"- {second.name} — {second.station_code}\n"
     )
-    return f"{label}:\n{formatted}\n"
@@ -4,14 +4,17 @@ import os
 from dataclasses import dataclass
 from typing import Optional, Self
 
+_RTT_BASE_URL = "https://api.rtt.io"
+_TRANSPORT_API_BASE_URL = "https://transportapi.com/v3"
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RttSettings:
     """Credentials and options for the RealTimeTrains API."""
 
     username: str
     password: str
-    base_url: str = "https://api.rtt.io"
+    base_url: str = _RTT_BASE_URL
 
     @classmethod
     def from_env_optional(cls) -> Optional[Self]:
@@ -20,17 +23,17 @@ class RttSettings:
         if not username or not password:
             return None
 
-        base_url = os.environ.get("RTT_BASE_URL", cls.base_url)
+        base_url = os.environ.get("RTT_BASE_URL", _RTT_BASE_URL)
         return cls(username=username, password=password, base_url=base_url)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransportApiSettings:
     """Settings required to authenticate with TransportAPI."""
 
     app_id: str
     app_key: str
-    base_url: str = "https://transportapi.com/v3"
+    base_url: str = _TRANSPORT_API_BASE_URL
 
     @classmethod
     def from_env_optional(cls) -> Optional[Self]:
@@ -38,11 +41,11 @@ class TransportApiSettings:
         app_key = os.environ.get("TRANSPORT_API_APP_KEY")
         if not app_id or not app_key:
             return None
-        base_url = os.environ.get("TRANSPORT_API_BASE_URL", cls.base_url)
+        base_url = os.environ.get("TRANSPORT_API_BASE_URL", _TRANSPORT_API_BASE_URL)
         return cls(app_id=app_id, app_key=app_key, base_url=base_url)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BotSettings:
     """Configuration options for the Telegram bot."""
 
@@ -53,7 +56,14 @@ class BotSettings:
 
     @classmethod
     def from_env(cls) -> Self:
-        """Create settings object from environment variables."""
+        """Create settings object from environment variables.
+
+        The result is cached, so repeated calls return the same instance.
+        """
+
+        global _CACHED_BOT_SETTINGS
+        if _CACHED_BOT_SETTINGS is not None:
+            return _CACHED_BOT_SETTINGS
 
         try:
             telegram_token = os.environ["TELEGRAM_BOT_TOKEN"]
@@ -72,9 +82,13 @@ class BotSettings:
             )
 
         limit = int(os.environ.get("DEFAULT_RESULT_LIMIT", 5))
-        return cls(
+        _CACHED_BOT_SETTINGS = cls(
             telegram_token=telegram_token,
             rtt_settings=rtt_settings,
             transport_settings=transport_settings,
             default_station_filter_limit=limit,
         )
+        return _CACHED_BOT_SETTINGS
+
+
+_CACHED_BOT_SETTINGS: Optional[BotSettings] = None
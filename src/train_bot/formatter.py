@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime as dt
+from itertools import islice
 from typing import Sequence
 
 from .models import Departure
@@ -19,26 +20,19 @@ def format_departures(
         header = _format_header(origin_name, destination_name, requested_time)
         return f"{header}\nNo matching services found."
 
-    lines = [_format_header(origin_name, destination_name, requested_time)]
+    parts = [_format_header(origin_name, destination_name, requested_time)]
+    append = parts.append
     for idx, service in enumerate(departures, start=1):
         destination = destination_name or service.destination_name
-        timing = _format_timing(service)
-        platform = f"Platform {service.platform}" if service.platform else "Platform TBC"
         operator = service.operator_name or service.service
-        calling_points = _format_calling_points(service)
-        lines.append(
-            "\n".join(
-                [
-                    f"{idx}. {origin_name} ➜ {destination}",
-                    timing,
-                    platform,
-                    f"Operator: {operator}",
-                    calling_points,
-                ]
-            )
-        )
-
-    return "\n\n".join(lines)
+        append("")
+        append(f"{idx}. {origin_name} ➜ {destination}")
+        append(_format_timing(service))
+        append(f"Platform {service.platform}" if service.platform else "Platform TBC")
+        append(f"Operator: {operator}")
+        append(_format_calling_points(service))
+
+    return "\n".join(parts)
 
 
 def _format_header(
@@ -73,5 +67,6 @@ def _format_calling_points(service: Departure) -> str:
     if not service.calling_points:
         return "Calling points data unavailable."
 
-    points = [point.station_name for point in service.calling_points]
-    return "Calling at: " + ", ".join(points[:6]) + ("…" if len(points) > 6 else "")
+    calling_points = service.calling_points
+    points = [point.station_name for point in islice(calling_points, 6)]
+    return "Calling at: " + ", ".join(points) + ("…" if len(calling_points) > 6 else "")
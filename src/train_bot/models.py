@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Optional, Sequence
 
+_TIDY_RE = re.compile(r"\bRail (Station|Stn)\b")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CallingPoint:
     station_name: str
     station_code: str
@@ -12,7 +15,7 @@ class CallingPoint:
     expected_arrival_time: Optional[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Departure:
     service_uid: str
     destination_name: str
@@ -25,7 +28,13 @@ class Departure:
     operator_name: Optional[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StationSummary:
     name: str
     station_code: str
+
+
+def tidy_station_name(name: str) -> str:
+    """Drop redundant "Rail Station"/"Rail Stn" suffixes from a station name."""
+
+    return _TIDY_RE.sub("", name).strip()
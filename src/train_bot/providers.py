@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Iterable, List, Sequence
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, List, Sequence
 
 import httpx
 
@@ -16,6 +17,14 @@ ProviderError = (RttError, TransportApiError)
 class RailProvider:
     name: str
     client: Any
+    _dispatch: dict[str, Callable[..., Any]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_dispatch",
+            {"search_station": self.search_station, "get_departures": self.get_departures},
+        )
 
     async def search_station(self, query: str, *, limit: int = 5) -> Sequence[StationSummary]:
         return await self.client.search_station(query, limit=limit)
@@ -55,7 +64,7 @@ async def call_with_fallback(
 
     for provider in providers:
         try:
-            func = getattr(provider, method)
+            func = provider._dispatch[method]
             result = await func(*args, **kwargs)
         except ProviderError as exc:
             errors.append(f"{provider.name}: {exc}")
@@ -77,3 +86,60 @@ async def call_with_fallback(
         raise AllProvidersFailed(errors)
 
     return [], None, errors
+
+
+async def call_concurrent(
+    providers: Iterable[RailProvider],
+    method: str,
+    *args,
+    **kwargs,
+):
+    """Race all providers and return the first non-empty result.
+
+    Every provider is queried, so each lookup counts against every provider's
+    quota. Once a provider answers with data the remaining calls are abandoned,
+    but clients that share in-flight requests may still let them run to
+    completion. If every provider comes back empty, the empty result from the
+    highest-priority provider is returned.
+    """
+
+    tasks = {
+        asyncio.create_task(provider._dispatch[method](*args, **kwargs)): provider
+        for provider in providers
+    }
+    errors: List[str] = []
+    empty_results = {}
+    pending = set(tasks)
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Walk completed tasks in provider priority order.
+            for task, provider in tasks.items():
+                if task not in done:
+                    continue
+                try:
+                    result = task.result()
+                except ProviderError as exc:
+                    errors.append(f"{provider.name}: {exc}")
+                    continue
+                except httpx.HTTPError as exc:
+                    errors.append(f"{provider.name}: network error {exc}")
+                    continue
+
+                if result:
+                    return result, provider.name, errors
+
+                empty_results[task] = result
+    finally:
+        for task in pending:
+            task.cancel()
+
+    for task, provider in tasks.items():
+        if task in empty_results:
+            return empty_results[task], provider.name, errors
+
+    if errors:
+        raise AllProvidersFailed(errors)
+
+    return [], None, errors
@@ -1,13 +1,60 @@
 from __future__ import annotations
 
 import datetime as dt
-from typing import Any, Optional, Sequence
-from urllib.parse import quote
+import string
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Optional, Sequence
 
 import httpx
+import orjson
 
+from .cache import SingleFlight, TtlCache
 from .config import RttSettings
-from .models import CallingPoint, Departure, StationSummary
+from .models import CallingPoint, Departure, StationSummary, tidy_station_name
+
+
+_EMPTY: dict[str, Any] = {}
+_REQUEST_CACHE_LIMIT = 1024
+
+# First truthy field wins when deriving a service status.
+_STATUS_RULES: tuple[tuple[str, Callable[[Any], str]], ...] = (
+    ("isCancelled", lambda _: "CANCELLED"),
+    ("displayAs", lambda value: value.upper()),
+    ("realtimeDepartureActual", lambda value: f"DEPARTED {value}"),
+    ("realtimeDeparture", lambda value: f"EXPECTED {value}"),
+)
+
+_SAFE_PATH_CHARS = frozenset(string.ascii_letters + string.digits + "-._~")
+_PERCENT_ENCODED = tuple(chr(b) if chr(b) in _SAFE_PATH_CHARS else f"%{b:02X}" for b in range(256))
+
+
+def _fast_quote(value: str) -> str:
+    """Percent-encode a path segment; equivalent to ``urllib.parse.quote(value, safe="")``."""
+
+    return "".join([_PERCENT_ENCODED[b] for b in value.encode()])
+
+
+def _departures_path(origin: str, destination: str) -> str:
+    if not destination:
+        return f"/api/v1/json/dep/{origin}"
+    return f"/api/v1/json/search/{origin}/to/{destination}"
+
+
+@lru_cache(maxsize=1024)
+def _parse_run_dt(run_date: str, aimed: str) -> dt.datetime:
+    """Combine an RTT ``YYYY-MM-DD`` run date with an ``HHMM`` (or ``HH:MM``) time."""
+
+    clock = aimed.replace(":", "")
+    if len(run_date) != 10 or len(clock) != 4:
+        raise ValueError(f"unexpected RTT timestamp {run_date!r} {aimed!r}")
+    return dt.datetime(
+        int(run_date[0:4]),
+        int(run_date[5:7]),
+        int(run_date[8:10]),
+        int(clock[0:2]),
+        int(clock[2:4]),
+    )
 
 
 class RttError(RuntimeError):
@@ -21,11 +68,17 @@ class RttClient:
         self._settings = settings
         self._client = httpx.AsyncClient(
             base_url=settings.base_url,
-            timeout=10.0,
+            timeout=httpx.Timeout(connect=2.0, read=8.0, write=8.0, pool=2.0),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0),
+            http2=True,
             headers={"Accept": "application/json"},
             follow_redirects=True,
             auth=httpx.BasicAuth(settings.username, settings.password),
         )
+        self._departure_requests: dict[tuple[str, str], httpx.Request] = {}
+        self._departure_cache: TtlCache[tuple, Sequence[Departure]] = TtlCache(maxsize=256, ttl=20.0)
+        self._departure_flights: SingleFlight[tuple, Sequence[Departure]] = SingleFlight()
+        self._search_flights: SingleFlight[tuple, Sequence[StationSummary]] = SingleFlight()
 
     async def close(self) -> None:
         await self._client.aclose()
@@ -39,21 +92,21 @@ class RttClient:
     async def search_station(self, query: str, *, limit: int = 5) -> Sequence[StationSummary]:
         """Return best matching stations for a user provided query."""
 
-        path = f"/api/v1/json/search/{quote(query, safe='')}"
-        response = await self._client.get(path)
-        payload = await self._json_or_error(response, "searching for stations")
-
-        locations = payload.get("locations", [])
-        matches: list[StationSummary] = []
-        for item in locations:
-            code = item.get("crs")
-            name = item.get("name") or item.get("description", "")
-            if not code or not name:
-                continue
-            matches.append(StationSummary(name=name, station_code=code))
-            if len(matches) >= limit:
-                break
-        return matches
+        return await self._search_flights.run(
+            (query, limit), lambda: self._search_station(query, limit=limit)
+        )
+
+    async def _search_station(self, query: str, *, limit: int) -> Sequence[StationSummary]:
+        path = f"/api/v1/json/search/{_fast_quote(query)}"
+        request = self._client.build_request("GET", path)
+        payload = await self._get_json(request, "searching for stations")
+
+        matches = (
+            StationSummary(name=tidy_station_name(name), station_code=item["crs"])
+            for item in payload.get("locations", ())
+            if item.get("crs") and (name := item.get("name") or item.get("description", ""))
+        )
+        return list(islice(matches, limit))
 
     async def get_departures(
         self,
@@ -67,13 +120,28 @@ class RttClient:
 
         origin = origin_crs.upper()
         destination = (destination_crs or "").upper()
-        if not destination:
-            path = f"/api/v1/json/dep/{origin}"
-        else:
-            path = f"/api/v1/json/search/{origin}/to/{destination}"
+        key = (origin, destination, limit, when.isoformat(timespec="minutes") if when else None)
+        cached = self._departure_cache.get(key)
+        if cached is not None:
+            return cached
+
+        departures = await self._departure_flights.run(
+            key, lambda: self._fetch_departures(origin, destination, limit=limit, when=when)
+        )
+        self._departure_cache.set(key, departures)
+        return departures
 
-        response = await self._client.get(path)
-        payload = await self._json_or_error(response, "requesting departures")
+    async def _fetch_departures(
+        self,
+        origin: str,
+        destination: str,
+        *,
+        limit: int,
+        when: Optional[dt.datetime],
+    ) -> Sequence[Departure]:
+        payload = await self._get_json(
+            self._departures_request(origin, destination), "requesting departures"
+        )
 
         services = payload.get("services", [])
         departures: list[Departure] = []
@@ -85,9 +153,12 @@ class RttClient:
 
             if when and run_date and aimed:
                 try:
-                    run_dt = dt.datetime.strptime(f"{run_date} {aimed}", "%Y-%m-%d %H:%M")
+                    run_dt = _parse_run_dt(run_date, aimed)
                 except ValueError:
                     run_dt = None
+                if run_dt and detail.get("gbttBookedDepartureNextDay"):
+                    # Calls after midnight keep the run date of the day the service started.
+                    run_dt += dt.timedelta(days=1)
                 if run_dt and run_dt < when:
                     continue
 
@@ -111,15 +182,37 @@ class RttClient:
 
         return departures[:limit]
 
-    async def _json_or_error(self, response: httpx.Response, action: str) -> dict[str, Any]:
-        if response.status_code >= 400:
-            raise RttError(
-                f"RealTimeTrains error {response.status_code} while {action}: {response.text[:200]}"
-            )
+    def _departures_request(self, origin: str, destination: str) -> httpx.Request:
+        # GET requests carry no body, so a built request can be re-sent as-is; the
+        # auth flow only re-applies the same Authorization header on each send.
+        key = (origin, destination)
+        request = self._departure_requests.get(key)
+        if request is None:
+            request = self._client.build_request("GET", _departures_path(origin, destination))
+            if len(self._departure_requests) >= _REQUEST_CACHE_LIMIT:
+                self._departure_requests.clear()
+            self._departure_requests[key] = request
+        return request
+
+    async def _get_json(self, request: httpx.Request, action: str) -> dict[str, Any]:
+        response = await self._client.send(request, stream=True)
+        try:
+            if response.status_code >= 400:
+                await response.aread()
+                raise RttError(
+                    f"RealTimeTrains error {response.status_code} while {action}: {response.text[:200]}"
+                )
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+        finally:
+            await response.aclose()
+
         try:
-            return response.json()
+            return orjson.loads(body)
         except ValueError as exc:
-            snippet = response.text[:200] or "<empty body>"
+            encoding = response.encoding or "utf-8"
+            snippet = body[:200].decode(encoding, errors="replace") or "<empty body>"
             content_type = response.headers.get("content-type", "unknown")
             raise RttError(
                 "RealTimeTrains returned a non-JSON response while "
@@ -136,33 +229,29 @@ class RttClient:
 
     @staticmethod
     def _parse_calling_points(detail: dict[str, Any]) -> Sequence[CallingPoint]:
-        call_points = detail.get("callPoints") or []
+        call_points = detail.get("callPoints") or ()
         parsed: list[CallingPoint] = []
+        append = parsed.append
         for point in call_points:
-            location = point.get("location") or {}
-            parsed.append(
+            get = point.get
+            location = get("location") or _EMPTY
+            append(
                 CallingPoint(
                     station_name=location.get("description", ""),
                     station_code=location.get("crs", ""),
-                    aimed_arrival_time=point.get("gbttBookedArrival") or point.get("gbttBookedPass"),
-                    expected_arrival_time=point.get("realtimeArrival") or point.get("realtimePass"),
+                    aimed_arrival_time=get("gbttBookedArrival") or get("gbttBookedPass"),
+                    expected_arrival_time=get("realtimeArrival") or get("realtimePass"),
                 )
             )
         return parsed
 
     @staticmethod
     def _derive_status(detail: dict[str, Any]) -> str:
-        if detail.get("isCancelled"):
-            return "CANCELLED"
-        display = detail.get("displayAs")
-        if display:
-            return display.upper()
-        realtime_actual = detail.get("realtimeDepartureActual")
-        if realtime_actual:
-            return f"DEPARTED {realtime_actual}"
-        realtime = detail.get("realtimeDeparture")
-        if realtime:
-            return f"EXPECTED {realtime}"
+        get = detail.get
+        for key, render in _STATUS_RULES:
+            value = get(key)
+            if value:
+                return render(value)
         return "UNKNOWN"
 
 
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional, Sequence
+
+from .cache import TtlCache
+from .models import StationSummary
+from .providers import RailProvider, call_concurrent
+
+_CACHE: TtlCache[tuple[str, int], tuple[Sequence[StationSummary], Optional[str]]] = TtlCache(
+    maxsize=1024, ttl=86400.0
+)
+
+
+async def search_station(
+    providers: Iterable[RailProvider],
+    query: str,
+    *,
+    limit: int = 5,
+) -> tuple[Sequence[StationSummary], Optional[str], list[str]]:
+    """Resolve a station query through the providers, reusing recent matches."""
+
+    key = (query.strip().lower(), limit)
+    cached = _CACHE.get(key)
+    if cached is not None:
+        stations, provider_name = cached
+        return stations, provider_name, []
+
+    stations, provider_name, errors = await call_concurrent(
+        providers, "search_station", query, limit=limit
+    )
+    if stations:
+        _CACHE.set(key, (tuple(stations), provider_name))
+    return stations, provider_name, errors
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import datetime as dt
+from itertools import islice
 from typing import Any, Optional, Sequence
 
 import httpx
+import orjson
 
+from .cache import SingleFlight, TtlCache
 from .config import TransportApiSettings
-from .models import CallingPoint, Departure, StationSummary
+from .models import CallingPoint, Departure, StationSummary, tidy_station_name
+
+_EMPTY: dict[str, Any] = {}
 
 
 class TransportApiError(RuntimeError):
@@ -20,10 +25,26 @@ class TransportApiClient:
         self._settings = settings
         self._client = httpx.AsyncClient(
             base_url=settings.base_url,
-            timeout=10.0,
+            timeout=httpx.Timeout(connect=2.0, read=8.0, write=8.0, pool=2.0),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0),
+            http2=True,
             headers={"Accept": "application/json"},
             follow_redirects=True,
         )
+        # Invariant query parameters, copied and extended per request.
+        self._departure_params = {
+            "app_id": settings.app_id,
+            "app_key": settings.app_key,
+            "station_detail": "calling_at",
+        }
+        self._search_params = {
+            "app_id": settings.app_id,
+            "app_key": settings.app_key,
+            "type": "train_station",
+        }
+        self._departure_cache: TtlCache[tuple, Sequence[Departure]] = TtlCache(maxsize=256, ttl=20.0)
+        self._departure_flights: SingleFlight[tuple, Sequence[Departure]] = SingleFlight()
+        self._search_flights: SingleFlight[tuple, Sequence[StationSummary]] = SingleFlight()
 
     async def close(self) -> None:
         await self._client.aclose()
@@ -42,12 +63,31 @@ class TransportApiClient:
         limit: int = 5,
         when: Optional[dt.datetime] = None,
     ) -> Sequence[Departure]:
-        params = {
-            "app_id": self._settings.app_id,
-            "app_key": self._settings.app_key,
-            "limit": str(limit),
-            "station_detail": "calling_at",
-        }
+        origin = origin_crs.upper()
+        destination = (destination_crs or "").upper()
+        key = (origin, destination, limit, when.isoformat(timespec="minutes") if when else None)
+        cached = self._departure_cache.get(key)
+        if cached is not None:
+            return cached
+
+        departures = await self._departure_flights.run(
+            key,
+            lambda: self._fetch_departures(
+                origin, destination_crs=destination or None, limit=limit, when=when
+            ),
+        )
+        self._departure_cache.set(key, departures)
+        return departures
+
+    async def _fetch_departures(
+        self,
+        origin_crs: str,
+        *,
+        destination_crs: Optional[str],
+        limit: int,
+        when: Optional[dt.datetime],
+    ) -> Sequence[Departure]:
+        params = {**self._departure_params, "limit": str(limit)}
         if destination_crs:
             params["calling_at"] = destination_crs
         if when:
@@ -55,44 +95,48 @@ class TransportApiClient:
             params["time"] = when.strftime("%H:%M")
 
         path = f"/uk/train/station/{origin_crs}/live.json"
-        response = await self._client.get(path, params=params)
-        payload = await self._json_or_error(response, "requesting departures")
+        payload = await self._get_json(path, "requesting departures", params)
 
         departures = payload.get("departures", {}).get("all", [])
         return [self._parse_departure(item) for item in departures][:limit]
 
     async def search_station(self, query: str, *, limit: int = 5) -> Sequence[StationSummary]:
-        params = {
-            "app_id": self._settings.app_id,
-            "app_key": self._settings.app_key,
-            "query": query,
-            "type": "train_station",
-            "limit": str(limit),
-        }
-        response = await self._client.get("/uk/places.json", params=params)
-        payload = await self._json_or_error(response, "searching for stations")
-
-        members = payload.get("member", [])
-        results: list[StationSummary] = []
-        for item in members:
-            code = item.get("station_code")
-            name = item.get("name")
-            if not code or not name:
-                continue
-            results.append(StationSummary(name=name, station_code=code))
-            if len(results) >= limit:
-                break
-        return results
-
-    async def _json_or_error(self, response: httpx.Response, action: str) -> dict[str, Any]:
-        if response.status_code >= 400:
-            raise TransportApiError(
-                f"TransportAPI error {response.status_code} while {action}: {response.text[:200]}"
-            )
+        return await self._search_flights.run(
+            (query, limit), lambda: self._search_station(query, limit=limit)
+        )
+
+    async def _search_station(self, query: str, *, limit: int) -> Sequence[StationSummary]:
+        params = {**self._search_params, "query": query, "limit": str(limit)}
+        payload = await self._get_json("/uk/places.json", "searching for stations", params)
+
+        results = (
+            StationSummary(name=tidy_station_name(item["name"]), station_code=item["station_code"])
+            for item in payload.get("member", ())
+            if item.get("station_code") and item.get("name")
+        )
+        return list(islice(results, limit))
+
+    async def _get_json(
+        self,
+        path: str,
+        action: str,
+        params: Optional[dict[str, str]] = None,
+    ) -> dict[str, Any]:
+        async with self._client.stream("GET", path, params=params) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                raise TransportApiError(
+                    f"TransportAPI error {response.status_code} while {action}: {response.text[:200]}"
+                )
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body += chunk
+
         try:
-            return response.json()
+            return orjson.loads(body)
         except ValueError as exc:
-            snippet = response.text[:200] or "<empty body>"
+            encoding = response.encoding or "utf-8"
+            snippet = body[:200].decode(encoding, errors="replace") or "<empty body>"
             content_type = response.headers.get("content-type", "unknown")
             raise TransportApiError(
                 "TransportAPI returned a non-JSON response while "
@@ -101,31 +145,38 @@ class TransportApiClient:
 
     @staticmethod
     def _parse_departure(data: dict[str, Any]) -> Departure:
-        station_details = data.get("station_detail") or {}
-        calling_points_data = station_details.get("calling_at") or data.get("calling_at") or []
-        calling_points = [
-            CallingPoint(
-                station_name=point.get("station_name", ""),
-                station_code=point.get("station_code", ""),
-                aimed_arrival_time=point.get("aimed_arrival_time") or point.get("aimed_pass_time"),
-                expected_arrival_time=point.get("expected_arrival_time"),
+        get = data.get
+        station_details = get("station_detail") or _EMPTY
+        calling_points_data = station_details.get("calling_at") or get("calling_at") or ()
+        calling_points: list[CallingPoint] = []
+        append = calling_points.append
+        for point in calling_points_data:
+            point_get = point.get
+            append(
+                CallingPoint(
+                    station_name=point_get("station_name", ""),
+                    station_code=point_get("station_code", ""),
+                    aimed_arrival_time=point_get("aimed_arrival_time") or point_get("aimed_pass_time"),
+                    expected_arrival_time=point_get("expected_arrival_time"),
+                )
             )
-            for point in calling_points_data
-        ]
 
         destination_name = TransportApiClient._extract_destination_name(data)
-        destination_code = TransportApiClient._find_destination_code(destination_name, calling_points)
+        # Reversed so the first calling point wins when a station appears twice.
+        name_to_code = {point.station_name: point.station_code for point in reversed(calling_points)}
+        destination_code = name_to_code.get(destination_name, "")
 
+        aimed = get("aimed_departure_time")
         return Departure(
-            service_uid=data.get("train_uid", ""),
+            service_uid=get("train_uid", ""),
             destination_name=destination_name,
             destination_code=destination_code,
-            platform=data.get("platform"),
-            aimed_departure_time=data.get("aimed_departure_time"),
-            expected_departure_time=data.get("expected_departure_time") or data.get("aimed_departure_time"),
-            status=data.get("status", ""),
+            platform=get("platform"),
+            aimed_departure_time=aimed,
+            expected_departure_time=get("expected_departure_time") or aimed,
+            status=get("status", ""),
             calling_points=calling_points,
-            operator_name=data.get("operator_name") or data.get("operator"),
+            operator_name=get("operator_name") or get("operator"),
         )
 
     @staticmethod
@@ -135,13 +186,6 @@ class TransportApiClient:
             return destination[0]
         return destination or "Unknown"
 
-    @staticmethod
-    def _find_destination_code(name: str, calling_points: Sequence[CallingPoint]) -> str:
-        for point in calling_points:
-            if point.station_name == name:
-                return point.station_code
-        return ""
-
 
 def create_transport_client(settings: TransportApiSettings) -> TransportApiClient:
     return TransportApiClient(settings)